@@ -19,6 +19,37 @@ from shortcut import Shortcut
 from robotide.widgets import ImageProvider
 
 
+_LINE_RE = re.compile(r'''^[ \t]*
+    (?:\[(?P<menu>[^\]\n]+)\]
+      |(?P<separator>---[^\n]*?)
+      |(?P<name>[^ \t\n|][^|\n]*?)
+        (?:[ \t]*\|[ \t]*(?P<doc>[^|\n]*?)
+          (?:[ \t]*\|[ \t]*(?P<shortcut>[^|\n]*?)
+            (?:[ \t]*\|[ \t]*(?P<icon>[^|\n]*?)
+              (?:[ \t]*\|[ \t]*(?P<position>[^\n]*?))?)?)?)?
+    )[ \t]*$''', re.MULTILINE | re.VERBOSE)
+
+# Plugins feed the same static DSL strings through the parser on every
+# (re)load, so the per-name results are cached. Both functions are pure
+# on their string argument which makes the caching safe.
+_parsed_name_cache = {}
+_parsed_shortcut_cache = {}
+_shortcut_cache = {}
+
+
+def _make_shortcut(shortcut):
+    """Returns a shared `Shortcut` for the given value.
+
+    Most actions have no shortcut at all and popular ones like ``Ctrl-S``
+    repeat across menus, so the immutable `Shortcut` value objects are
+    created only once per unique value.
+    """
+    result = _shortcut_cache.get(shortcut)
+    if result is None:
+        result = _shortcut_cache[shortcut] = Shortcut(shortcut)
+    return result
+
+
 def ActionInfoCollection(data, event_handler, container=None):
     """Parses the ``data`` into a list of `ActionInfo` and `SeparatorInfo` objects.
 
@@ -103,26 +134,40 @@ def ActionInfoCollection(data, event_handler, container=None):
         Content Assist (Ctrl-Space or Ctrl-Alt-Space) | Has two shortcuts.
     """
 
+    return list(_iter_action_infos(data, event_handler, container))
+
+
+def _iter_action_infos(data, event_handler, container):
     menu = None
-    actions = []
-    for row in data.splitlines():
-        row = row.strip()
-        if not row:
-            continue
-        elif row.startswith('[') and row.endswith(']'):
-            menu = row[1:-1].strip()
+    for token, value in _tokenize(data):
+        if token == 'menu':
+            menu = value
+        elif token == 'separator':
+            yield SeparatorInfo(menu)
+        else:
+            yield _create_action_info(event_handler, menu, container, value)
+
+
+def _tokenize(data):
+    """Tokenizes the action DSL with a single scan over the data.
+
+    Yields ``('menu', name)``, ``('separator', None)`` and
+    ``('action', (name, doc, shortcut, icon, position))`` events in the
+    order the corresponding lines appear in the data.
+    """
+    for match in _LINE_RE.finditer(data):
+        menu, separator, name, doc, shortcut, icon, position = match.groups()
+        if menu is not None:
+            yield 'menu', menu.strip()
+        elif separator is not None:
+            yield 'separator', None
         else:
-            actions.append(_create_action_info(event_handler, menu, container,
-                                               row))
-    return actions
+            yield 'action', (name, doc or '', shortcut or '', icon or '',
+                             position or '')
 
 
-def _create_action_info(eventhandler, menu, container, row):
-    if row.startswith('---'):
-        return SeparatorInfo(menu)
-    tokens = [ t.strip() for t in row.split('|') ]
-    tokens += [''] * (5-len(tokens))
-    name, doc, shortcut, icon, position =  tokens
+def _create_action_info(eventhandler, menu, container, tokens):
+    name, doc, shortcut, icon, position = tokens
     if name.startswith('!'):
         name = name[1:]
         container = None
@@ -131,19 +176,32 @@ def _create_action_info(eventhandler, menu, container, row):
     return ActionInfo(menu, name, action, container, shortcut, icon, doc, position)
 
 def _get_eventhandler_name_and_parsed_name(name):
-    eventhandler_name, name = _parse_shortcuts_from_name(name)
-    return ('On%s' % eventhandler_name.replace(' ', '').replace('&', '') ,
-            name)
+    result = _parsed_name_cache.get(name)
+    if result is None:
+        eventhandler_name, parsed_name = _parse_shortcuts_from_name(name)
+        result = _parsed_name_cache[name] = \
+            ('On%s' % eventhandler_name.translate(None, ' &'), parsed_name)
+    return result
 
 def _parse_shortcuts_from_name(name):
-    if '(' in name:
-        eventhandler_name, shortcuts = name.split('(', 1)
-        shortcuts = shortcuts.split(')')[0]
-        elements = shortcuts.split(' or ')
-        name = '%s (%s)' % (eventhandler_name,
-                            ' or '.join(Shortcut(e).printable for e in elements))
-        return eventhandler_name, name
-    return name, name
+    result = _parsed_shortcut_cache.get(name)
+    if result is None:
+        result = _parsed_shortcut_cache[name] = \
+            _do_parse_shortcuts_from_name(name)
+    return result
+
+def _do_parse_shortcuts_from_name(name):
+    start = name.find('(')
+    if start < 0:
+        return name, name
+    end = name.find(')', start + 1)
+    if end < 0:
+        return name, name
+    eventhandler_name = name[:start]
+    elements = name[start+1:end].split(' or ')
+    name = '%s (%s)' % (eventhandler_name,
+                        ' or '.join(Shortcut(e).printable for e in elements))
+    return eventhandler_name, name
 
 class MenuInfo(object):
     """Base class for `ActionInfo` and `SeparatorInfo`."""
@@ -171,6 +229,7 @@ class MenuInfo(object):
 
 class ActionInfo(MenuInfo):
     """Used to create menu entries, keyboard shortcuts and/or toolbar buttons."""
+    _icon_cache = {}
 
     def __init__(self, menu_name, name, action=None, container=None,
                  shortcut=None, icon=None, doc='', position=-1):
@@ -220,7 +279,7 @@ class ActionInfo(MenuInfo):
         self.name = name
         self.action = action
         self.container = container
-        self.shortcut = Shortcut(shortcut)
+        self.shortcut = _make_shortcut(shortcut)
         self._icon = None
         self._icon_source = icon
         self.doc = doc
@@ -233,14 +292,21 @@ class ActionInfo(MenuInfo):
         return self._icon
 
     def _get_icon(self):
-        if not self._icon_source:
+        source = self._icon_source
+        if not source:
             return None
-        if isinstance(self._icon_source, basestring):
-            if self._icon_source.startswith("CUSTOM_"):
-                return ImageProvider().get_image_by_name(self._icon_source[len("CUSTOM_"):])
-            return wx.ArtProvider.GetBitmap(getattr(wx, self._icon_source),
-                                            wx.ART_TOOLBAR, (16, 16))
-        return self._icon_source
+        if not isinstance(source, basestring):
+            return source
+        icon = self._icon_cache.get(source)
+        if icon is None:
+            icon = self._icon_cache[source] = self._load_icon(source)
+        return icon
+
+    def _load_icon(self, source):
+        if source.startswith("CUSTOM_"):
+            return ImageProvider().get_image_by_name(source[len("CUSTOM_"):])
+        return wx.ArtProvider.GetBitmap(getattr(wx, source),
+                                        wx.ART_TOOLBAR, (16, 16))
 
     @property
     def position(self):
@@ -287,11 +353,14 @@ class _InsertionPoint(object):
         return index
 
     def _find_position_in_menu(self, menu):
+        name = self._item.lower()
+        get_item = menu.FindItemByPosition
         for index in range(0, menu.GetMenuItemCount()):
-            item = menu.FindItemByPosition(index)
-            if self._get_menu_item_name(item).lower() == self._item.lower():
+            if self._get_menu_item_name(get_item(index)).lower() == name:
                 return index
         return None
 
     def _get_menu_item_name(self, item):
-        return self._shortcut_remover.split(item.GetLabel())[0]
+        label = item.GetLabel()
+        match = self._shortcut_remover.search(label)
+        return label[:match.start()] if match else label
@@ -54,24 +54,26 @@ class _ClipboardHandler(object):
     def _paste_to_cell_editor(self):
         clipboard = self._clipboard.get_contents()
         if isinstance(clipboard, list):
-            cells_as_text = ' '.join([' '.join(row) for row in clipboard])
+            cells_as_text = ' '.join(value for row in clipboard
+                                     for value in row)
             self._get_edit_control().WriteText(cells_as_text)
 
     def _paste_to_grid(self):
         clipboard = self._clipboard.get_contents()
         if not clipboard:
             return
-        cell = self._get_starting_cell()
-        if not isinstance(clipboard, list):
-            self._write_cell(cell.row, cell.col, clipboard)
-        else:
-            row = cell.row
-            for datarow in clipboard:
-                col = cell.col
-                for value in datarow:
-                    self._write_cell(row, col, value)
-                    col += 1
-                row += 1
+        toprow, leftcol = self._get_starting_cell()
+        self._grid.BeginBatch()
+        try:
+            if not isinstance(clipboard, list):
+                self._write_cell(toprow, leftcol, clipboard)
+            else:
+                write_cell = self._write_cell
+                for row, datarow in enumerate(clipboard, toprow):
+                    for col, value in enumerate(datarow, leftcol):
+                        write_cell(row, col, value)
+        finally:
+            self._grid.EndBatch()
 
     def _get_starting_cell(self):
         return self._grid.selection.topleft
@@ -104,8 +106,8 @@ class _WindowsClipboardHandler(_ClipboardHandler):
         self._get_edit_control().Paste()
 
 
-ClipboardHandler = IS_WINDOWS and _WindowsClipboardHandler\
-                                    or _ClipboardHandler
+ClipboardHandler = _WindowsClipboardHandler if IS_WINDOWS \
+    else _ClipboardHandler
 
 
 class _GridClipboard(object):
@@ -12,6 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from collections import namedtuple
+
 import wx
 from wx import grid
 
@@ -22,6 +24,7 @@ from clipboard import ClipboardHandler
 
 class GridEditor(grid.Grid):
     _col_add_threshold = 1
+    _clipboard_handler_class = ClipboardHandler
     _popup_items = [
         'Insert Cells\tCtrl-Shift-I', 'Delete Cells\tCtrl-Shift-D',
         'Insert Rows\tCtrl-I', 'Delete Rows\tCtrl-D', '---',
@@ -34,7 +37,7 @@ class GridEditor(grid.Grid):
         self._bind_to_events()
         self.selection = _GridSelection(self)
         self.SetDefaultRenderer(grid.GridCellAutoWrapStringRenderer())
-        self._clipboard_handler = ClipboardHandler(self)
+        self._clipboard_handler = self._clipboard_handler_class(self)
         self._history = _GridState()
         self.CreateGrid(num_rows, num_cols)
         self._popup_creator = popup_creator or PopupCreator()
@@ -93,8 +96,12 @@ class GridEditor(grid.Grid):
         self._clear_selected_cells()
 
     def _clear_selected_cells(self):
-        for row, col in self.selection.cells():
-            self.write_cell(row, col, '', update_history=False)
+        self.BeginBatch()
+        try:
+            for row, col in self.selection.cells():
+                self.write_cell(row, col, '', update_history=False)
+        finally:
+            self.EndBatch()
 
     def paste(self):
         self._update_history()
@@ -135,7 +142,8 @@ class GridEditor(grid.Grid):
         return self.GetCellValue(*self.selection.cell)
 
     def _get_block_content(self, row_range, col_range):
-        return [[self.GetCellValue(row, col) for col in col_range]
+        value = self.GetCellValue
+        return [[value(row, col) for col in col_range]
                  for row in row_range]
 
     def _strip_trailing_empty_cells(self, rowdata):
@@ -187,7 +195,7 @@ class GridEditor(grid.Grid):
             self.SelectBlock(self.selection.topleft.row, self.selection.topleft.col,self.selection.bottomright.row, self.selection.bottomright.col, addToSelected=True)
         else:
             self.selection.set_from_single_selection(event)
-        self.AutoSizeRows()
+        self.AutoSizeRow(event.Row)
         event.Skip()
 
     def OnRangeSelect(self, event):
@@ -236,7 +244,7 @@ class GridEditor(grid.Grid):
 
     def _delete_cells(self, data):
         cols = self.selection.cols()
-        left, right = cols[0], cols[-1] + 1
+        left, right = cols[0], cols[0] + len(cols)
         data[left:right] = []
         return data + [''] * len(cols)
 
@@ -264,6 +272,7 @@ class _GridSelection(object):
     def _set(self, topleft, bottomright=None):
         self.topleft = _Cell(topleft[0], topleft[1])
         self.bottomright = self._count_bottomright(topleft, bottomright)
+        self._rows = self._cols = None
 
     def _count_bottomright(self, topleft, bottomright):
         if not bottomright:
@@ -290,28 +299,25 @@ class _GridSelection(object):
                (event.BottomRightCoords.Row, event.BottomRightCoords.Col)
 
     def rows(self):
-        """Returns a list containing indices of rows currently selected."""
-        return range(self.topleft.row, self.bottomright.row + 1)
+        """Returns an iterable containing indices of rows currently selected."""
+        if self._rows is None:
+            self._rows = xrange(self.topleft.row, self.bottomright.row + 1)
+        return self._rows
 
     def cols(self):
-        """Returns a list containing indices of columns currently selected."""
-        return range(self.topleft.col, self.bottomright.col + 1)
+        """Returns an iterable containing indices of columns currently selected."""
+        if self._cols is None:
+            self._cols = xrange(self.topleft.col, self.bottomright.col + 1)
+        return self._cols
 
     def cells(self):
-        """Return selected cells as a list of tuples (row, column)."""
-        return [(row, col) for col in self.cols()
-                           for row in self.rows()]
-
-
-class _Cell(object):
+        """Yields the currently selected cells as (row, column) tuples."""
+        for col in self.cols():
+            for row in self.rows():
+                yield row, col
 
-    def __init__(self, row, col):
-        self.row = row
-        self.col = col
 
-    def __iter__(self):
-        for item in self.row, self.col:
-            yield item
+_Cell = namedtuple('_Cell', ['row', 'col'])
 
 
 class _GridState(object):
@@ -245,7 +245,7 @@ class KeywordEditor(GridEditor, RideEventHandler):
         self._row_move(MoveRowsDown, 1)
 
     def _row_move(self, command, change):
-        rows = self.selection.rows()
+        rows = list(self.selection.rows())
         if self._execute(command(rows)):
             wx.CallAfter(self._select_rows, [r+change for r in rows])
 
@@ -593,7 +593,7 @@ work.</li>
             self._execute(ExtractKeyword(name, args, rows))
 
     def OnExtractVariable(self, event):
-        cells = self.selection.cells()
+        cells = list(self.selection.cells())
         if len(cells) == 1:
             self._extract_scalar(cells[0])
         elif min(row for row, _ in cells) == max(row for row, _ in cells):
@@ -605,7 +605,7 @@ work.</li>
             self._execute_find_where_used(is_variable, searchstring)
 
     def _get_is_variable_and_searchstring(self):
-        cellvalue = self.GetCellValue(*self.selection.cells()[0])
+        cellvalue = self.GetCellValue(*self.selection.cell)
         if self._cell_value_contains_multiple_search_items(cellvalue):
             choice_dialog = ChooseUsageSearchStringDialog(cellvalue)
             choice_dialog.ShowModal()